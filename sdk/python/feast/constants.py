@@ -31,6 +31,15 @@ FEAST_USAGE = "FEAST_USAGE"
 # Environment variable for the path for overwriting universal test configs
 FULL_REPO_CONFIGS_MODULE_ENV_NAME: str = "FULL_REPO_CONFIGS_MODULE"
 
+# Environment variable for restricting universal test configs to a comma separated list of providers
+FULL_REPO_CONFIGS_PROVIDERS_ENV_NAME: str = "FEAST_TEST_PROVIDERS"
+
+# Environment variable for a directory to cache generated universal test datasets in. Caching is disabled if unset
+TEST_DATASET_CACHE_DIR_ENV_NAME: str = "FEAST_TEST_DATASET_CACHE_DIR"
+
+# Environment variable for sharing a single BigQuery dataset between universal test environments, when set to "1"
+TEST_REUSE_BIGQUERY_DATASET_ENV_NAME: str = "FEAST_TEST_REUSE_PROJECT"
+
 # Environment variable for overwriting FTS port
 FEATURE_TRANSFORMATION_SERVER_PORT_ENV_NAME: str = "FEATURE_TRANSFORMATION_SERVER_PORT"
 
@@ -29,6 +29,37 @@ def _convert_event_timestamp(event_timestamp: pd.Timestamp, t: EventTimestampTyp
         return event_timestamp.replace(tzinfo=utc).astimezone(timezone("US/Pacific"))
 
 
+def _utc_timestamp_range(start_date, end_date, freq) -> pd.DatetimeIndex:
+    """
+    Returns the timestamps between start_date (inclusive) and end_date (exclusive) at the given frequency, in UTC and
+    rounded to milliseconds. Timezone-naive dates are treated as UTC.
+    """
+    timestamps = pd.date_range(start=start_date, end=end_date, freq=freq, closed="left")
+    if timestamps.tz is None:
+        timestamps = timestamps.tz_localize("UTC")
+    else:
+        timestamps = timestamps.tz_convert("UTC")
+    return timestamps.round("ms")
+
+
+def _create_entity_timestamps_df(
+    entity_column: str, entities, timestamps: pd.DatetimeIndex
+) -> pd.DataFrame:
+    """
+    Returns a dataframe with a row for every combination of entity and event timestamp. Entities are listed in
+    reverse order, each with all of the timestamps in order.
+    """
+    entities = list(entities)[::-1]
+    return pd.DataFrame(
+        {
+            "event_timestamp": timestamps[
+                np.tile(np.arange(len(timestamps)), len(entities))
+            ],
+            entity_column: pd.Series(entities).repeat(len(timestamps)).to_numpy(),
+        }
+    )
+
+
 def create_orders_df(
     customers, drivers, start_date, end_date, order_count, locations=None,
 ) -> pd.DataFrame:
@@ -93,30 +124,18 @@ def create_driver_hourly_stats_df(drivers, start_date, end_date) -> pd.DataFrame
     | 2021-03-17 19:31 |     5005  | 0.142936  | 0.707596 | 466             | 2021-03-24 19:34 |
     | 2021-03-17 19:31 |     5005  | 0.142936  | 0.707596 | 466             | 2021-03-24 19:34 |
     """
-    df_hourly = pd.DataFrame(
-        {
-            "event_timestamp": [
-                pd.Timestamp(dt, unit="ms", tz="UTC").round("ms")
-                for dt in pd.date_range(
-                    start=start_date, end=end_date, freq="1H", closed="left"
-                )
-            ]
-            # include a fixed timestamp for get_historical_features in the quickstart
-            + [
+    timestamps = _utc_timestamp_range(start_date, end_date, freq="1H")
+    # include a fixed timestamp for get_historical_features in the quickstart
+    timestamps = timestamps.append(
+        pd.DatetimeIndex(
+            [
                 pd.Timestamp(
                     year=2021, month=4, day=12, hour=7, minute=0, second=0, tz="UTC"
                 )
             ]
-        }
+        )
     )
-    df_all_drivers = pd.DataFrame()
-
-    for driver in drivers:
-        df_hourly_copy = df_hourly.copy()
-        df_hourly_copy["driver_id"] = driver
-        df_all_drivers = pd.concat([df_hourly_copy, df_all_drivers])
-
-    df_all_drivers.reset_index(drop=True, inplace=True)
+    df_all_drivers = _create_entity_timestamps_df("driver_id", drivers, timestamps)
     rows = df_all_drivers["event_timestamp"].count()
 
     df_all_drivers["conv_rate"] = np.random.random(size=rows).astype(np.float32)
@@ -154,24 +173,9 @@ def create_customer_daily_profile_df(customers, start_date, end_date) -> pd.Data
     | 2021-03-22 19:31 | 1001        | 0.943030        |     0.561219        |          322        | 2021-03-24 19:38 |
     | 2021-03-23 19:31 | 1001        | 0.354919        |     0.810093        |          273        | 2021-03-24 19:38 |
     """
-    df_daily = pd.DataFrame(
-        {
-            "event_timestamp": [
-                pd.Timestamp(dt, unit="ms", tz="UTC").round("ms")
-                for dt in pd.date_range(
-                    start=start_date, end=end_date, freq="1D", closed="left"
-                )
-            ]
-        }
+    df_all_customers = _create_entity_timestamps_df(
+        "customer_id", customers, _utc_timestamp_range(start_date, end_date, freq="1D"),
     )
-    df_all_customers = pd.DataFrame()
-
-    for customer in customers:
-        df_daily_copy = df_daily.copy()
-        df_daily_copy["customer_id"] = customer
-        df_all_customers = pd.concat([df_daily_copy, df_all_customers])
-
-    df_all_customers.reset_index(drop=True, inplace=True)
 
     rows = df_all_customers["event_timestamp"].count()
 
@@ -199,24 +203,9 @@ def create_location_stats_df(locations, start_date, end_date) -> pd.DataFrame:
     | 2021-03-17 21:31 |          19 |          65 | 2021-03-24 19:38 |
     | 2021-03-17 22:31 |          35 |          86 | 2021-03-24 19:38 |
     """
-    df_hourly = pd.DataFrame(
-        {
-            "event_timestamp": [
-                pd.Timestamp(dt, unit="ms", tz="UTC").round("ms")
-                for dt in pd.date_range(
-                    start=start_date, end=end_date, freq="1H", closed="left"
-                )
-            ]
-        }
+    df_all_locations = _create_entity_timestamps_df(
+        "location_id", locations, _utc_timestamp_range(start_date, end_date, freq="1H"),
     )
-    df_all_locations = pd.DataFrame()
-
-    for location in locations:
-        df_hourly_copy = df_hourly.copy()
-        df_hourly_copy["location_id"] = location
-        df_all_locations = pd.concat([df_hourly_copy, df_all_locations])
-
-    df_all_locations.reset_index(drop=True, inplace=True)
     rows = df_all_locations["event_timestamp"].count()
 
     df_all_locations["temperature"] = np.random.randint(50, 100, size=rows).astype(
@@ -247,14 +236,7 @@ def create_global_daily_stats_df(start_date, end_date) -> pd.DataFrame:
     | 2021-03-28 19:00 | 79          | 0.354919        | 2021-03-24 19:38 |
     """
     df_daily = pd.DataFrame(
-        {
-            "event_timestamp": [
-                pd.Timestamp(dt, unit="ms", tz="UTC").round("ms")
-                for dt in pd.date_range(
-                    start=start_date, end=end_date, freq="1D", closed="left"
-                )
-            ]
-        }
+        {"event_timestamp": _utc_timestamp_range(start_date, end_date, freq="1D")}
     )
     rows = df_daily["event_timestamp"].count()
 
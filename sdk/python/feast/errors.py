@@ -211,6 +211,18 @@ class FeastJoinKeysDuringMaterialization(Exception):
         )
 
 
+class FileSourceMissingColumns(Exception):
+    def __init__(
+        self, source: str, missing_columns: List[str], source_columns: List[str]
+    ):
+        self.missing_columns = missing_columns
+        self.source_columns = source_columns
+        super().__init__(
+            f"The file source {source} is missing the columns {missing_columns}, it only has the columns "
+            f"{source_columns}."
+        )
+
+
 class DockerDaemonNotRunning(Exception):
     def __init__(self):
         super().__init__(
@@ -247,6 +259,22 @@ class RedshiftQueryError(Exception):
         super().__init__(f"Redshift SQL Query failed to finish. Details: {details}")
 
 
+class DynamoDBTableSchemaMismatch(Exception):
+    def __init__(self, table_name: str):
+        super().__init__(
+            f"DynamoDB table {table_name} exists, but isn't keyed on binary entity ids. It was likely created by an "
+            "older version of Feast. Run `feast teardown` and then `feast apply`, and materialize the feature view "
+            "again to recreate the table."
+        )
+
+
+class DynamoDBUnprocessedItemsError(Exception):
+    def __init__(self, table_name: str, operation: str, attempts: int):
+        super().__init__(
+            f"{operation} on DynamoDB table {table_name} still had unprocessed items after {attempts} attempts."
+        )
+
+
 class EntityTimestampInferenceException(Exception):
     def __init__(self, expected_column_name: str):
         super().__init__(
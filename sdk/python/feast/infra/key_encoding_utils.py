@@ -5,6 +5,10 @@ from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.protos.feast.types.Value_pb2 import ValueType
 
+_pack_uint32 = struct.Struct("<I").pack
+_pack_int32 = struct.Struct("<i").pack
+_pack_int64 = struct.Struct("<l").pack
+
 
 def _serialize_val(value_type, v: ValueProto) -> Tuple[bytes, int]:
     if value_type == "string_val":
@@ -12,9 +16,9 @@ def _serialize_val(value_type, v: ValueProto) -> Tuple[bytes, int]:
     elif value_type == "bytes_val":
         return v.bytes_val, ValueType.BYTES
     elif value_type == "int32_val":
-        return struct.pack("<i", v.int32_val), ValueType.INT32
+        return _pack_int32(v.int32_val), ValueType.INT32
     elif value_type == "int64_val":
-        return struct.pack("<l", v.int64_val), ValueType.INT64
+        return _pack_int64(v.int64_val), ValueType.INT64
     else:
         raise ValueError(f"Value type not supported for Firestore: {v}")
 
@@ -45,20 +49,24 @@ def serialize_entity_key(entity_key: EntityKeyProto) -> bytes:
 
     [1] https://developers.google.com/protocol-buffers/docs/encoding
     """
-    sorted_keys, sorted_values = zip(
-        *sorted(zip(entity_key.join_keys, entity_key.entity_values))
-    )
+    if len(entity_key.join_keys) == 1:
+        # Most entity keys have a single join key, which doesn't need sorting.
+        sorted_keys, sorted_values = entity_key.join_keys, entity_key.entity_values
+    else:
+        sorted_keys, sorted_values = zip(
+            *sorted(zip(entity_key.join_keys, entity_key.entity_values))
+        )
 
     output: List[bytes] = []
     for k in sorted_keys:
-        output.append(struct.pack("<I", ValueType.STRING))
+        output.append(_pack_uint32(ValueType.STRING))
         output.append(k.encode("utf8"))
     for v in sorted_values:
         val_bytes, value_type = _serialize_val(v.WhichOneof("val"), v)
 
-        output.append(struct.pack("<I", value_type))
+        output.append(_pack_uint32(value_type))
 
-        output.append(struct.pack("<I", len(val_bytes)))
+        output.append(_pack_uint32(len(val_bytes)))
         output.append(val_bytes)
 
     return b"".join(output)
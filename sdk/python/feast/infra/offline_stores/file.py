@@ -1,26 +1,31 @@
-from datetime import datetime
+import functools
+import os
+from datetime import datetime, timedelta
+from multiprocessing.pool import ThreadPool
 from typing import Callable, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 import pyarrow
-import pytz
+import pyarrow.dataset
 from pydantic.typing import Literal
 
 from feast import FileSource, OnDemandFeatureView
 from feast.data_source import DataSource
-from feast.errors import FeastJoinKeysDuringMaterialization
+from feast.errors import FeastJoinKeysDuringMaterialization, FileSourceMissingColumns
 from feast.feature_view import DUMMY_ENTITY_ID, DUMMY_ENTITY_VAL, FeatureView
 from feast.infra.offline_stores.offline_store import OfflineStore, RetrievalJob
 from feast.infra.offline_stores.offline_utils import (
     DEFAULT_ENTITY_DF_EVENT_TIMESTAMP_COL,
 )
-from feast.infra.provider import (
-    _get_requested_feature_views_to_features_dict,
-    _run_field_mapping,
-)
+from feast.infra.provider import _get_requested_feature_views_to_features_dict
 from feast.registry import Registry
 from feast.repo_config import FeastConfigBaseModel, RepoConfig
 
+_JOIN_KEY_CODE_COLUMN = "__feast_join_key_code"
+
+_TIMESTAMP_UNIT_NANOS = {"s": 10 ** 9, "ms": 10 ** 6, "us": 10 ** 3, "ns": 1}
+
 
 class FileOfflineStoreConfig(FeastConfigBaseModel):
     """ Offline store config for local (file-based) store """
@@ -59,7 +64,7 @@ class FileRetrievalJob(RetrievalJob):
     def _to_arrow_internal(self):
         # Only execute the evaluation function to build the final historical retrieval dataframe at the last moment.
         df = self.evaluation_function()
-        return pyarrow.Table.from_pandas(df)
+        return pyarrow.Table.from_pandas(df, preserve_index=False)
 
 
 class FileOfflineStore(OfflineStore):
@@ -103,136 +108,204 @@ class FileOfflineStore(OfflineStore):
         # Create lazy function that is only called from the RetrievalJob object
         def evaluate_historical_retrieval():
 
-            # Make sure all event timestamp fields are tz-aware. We default tz-naive fields to UTC
-            entity_df[entity_df_event_timestamp_col] = entity_df[
-                entity_df_event_timestamp_col
-            ].apply(lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc))
-
-            # Create a copy of entity_df to prevent modifying the original
-            entity_df_with_features = entity_df.copy()
-
             # Convert event timestamp column to datetime and normalize time zone to UTC
             # This is necessary to avoid issues with pd.merge_asof
-            entity_df_with_features[entity_df_event_timestamp_col] = pd.to_datetime(
-                entity_df_with_features[entity_df_event_timestamp_col], utc=True
-            )
+            event_timestamps = _normalize_timestamp_to_utc(
+                entity_df[entity_df_event_timestamp_col]
+            ).reset_index(drop=True)
+
+            # Sort event timestamp values. Taking the rows in sorted order already builds a new
+            # dataframe, so the original entity_df isn't modified and doesn't need to be copied first
+            event_timestamps = event_timestamps.sort_values()
+            entity_df_with_features = entity_df.take(event_timestamps.index)
+            entity_df_with_features[
+                entity_df_event_timestamp_col
+            ] = event_timestamps.array
 
-            # Sort event timestamp values
-            entity_df_with_features = entity_df_with_features.sort_values(
+            # Feature rows outside of this range can't be joined to any entity row. The timestamps
+            # are sorted with missing values last, so the bounds can be read off the ends directly
+            entity_df_event_timestamps = entity_df_with_features[
                 entity_df_event_timestamp_col
-            )
+            ]
+            num_event_timestamps = entity_df_event_timestamps.count()
+            if num_event_timestamps:
+                entity_df_event_timestamp_range = (
+                    entity_df_event_timestamps.iloc[0],
+                    entity_df_event_timestamps.iloc[num_event_timestamps - 1],
+                )
+            else:
+                entity_df_event_timestamp_range = (pd.NaT, pd.NaT)
+
+            # Look up each entity once, rather than once for every feature view that uses it
+            entities = {
+                entity_name: registry.get_entity(entity_name, project)
+                for entity_name in dict.fromkeys(
+                    entity_name
+                    for feature_view in feature_views_to_features
+                    for entity_name in feature_view.entities
+                )
+            }
 
-            # Load feature view data from sources and join them incrementally
+            # Work out which columns and time range each feature view needs from its source
+            feature_view_join_keys = {}
+            feature_view_reads = {}
+            source_reads = {}
             for feature_view, features in feature_views_to_features.items():
-                event_timestamp_column = (
-                    feature_view.batch_source.event_timestamp_column
+                batch_source = feature_view.batch_source
+                join_key_map = feature_view.projection.join_key_map
+
+                # Build a list of entity columns to join on (from the right table)
+                join_keys = []
+                for entity_name in feature_view.entities:
+                    entity = entities[entity_name]
+                    join_key = join_key_map.get(entity.join_key, entity.join_key)
+                    join_keys.append(join_key)
+                feature_view_join_keys[feature_view] = join_keys
+
+                # Only read the columns we need, named as in the source
+                reverse_field_mapping = {
+                    v: k for k, v in (batch_source.field_mapping or {}).items()
+                }
+                reverse_join_key_map = {v: k for k, v in join_key_map.items()}
+                columns = [batch_source.event_timestamp_column]
+                if batch_source.created_timestamp_column:
+                    columns.append(batch_source.created_timestamp_column)
+                columns += [reverse_join_key_map.get(k, k) for k in join_keys]
+                columns += features
+                columns = [reverse_field_mapping.get(c, c) for c in columns]
+
+                start_date = entity_df_event_timestamp_range[0]
+                if feature_view.ttl and not pd.isna(start_date):
+                    start_date = start_date - feature_view.ttl
+                else:
+                    start_date = None
+
+                # Feature views backed by the same file share a single read, covering the union of
+                # their columns and time ranges
+                source_event_timestamp_column = reverse_field_mapping.get(
+                    batch_source.event_timestamp_column,
+                    batch_source.event_timestamp_column,
                 )
-                created_timestamp_column = (
-                    feature_view.batch_source.created_timestamp_column
+                source_key = _source_key(batch_source, source_event_timestamp_column)
+                feature_view_reads[feature_view] = (source_key, columns)
+                if source_key in source_reads:
+                    source, source_columns, _, source_start_date = source_reads[
+                        source_key
+                    ]
+                    source_columns.extend(columns)
+                    if source_start_date is None or start_date is None:
+                        start_date = None
+                    else:
+                        start_date = min(start_date, source_start_date)
+                else:
+                    source, source_columns = batch_source, list(columns)
+                source_reads[source_key] = (
+                    source,
+                    source_columns,
+                    source_event_timestamp_column,
+                    start_date,
                 )
 
-                # Read offline parquet data in pyarrow format.
-                filesystem, path = FileSource.create_filesystem_and_path(
-                    feature_view.batch_source.path,
-                    feature_view.batch_source.file_options.s3_endpoint_override,
+            # Read offline parquet data in pyarrow format, once per source. Scans release the GIL while
+            # doing I/O and decoding, so independent sources are read concurrently
+            end_date = entity_df_event_timestamp_range[1]
+            with ThreadPool(
+                processes=max(1, min(len(source_reads), os.cpu_count() or 1))
+            ) as pool:
+                tables = pool.starmap(
+                    functools.partial(
+                        _read_parquet_table,
+                        end_date=None if pd.isna(end_date) else end_date,
+                    ),
+                    source_reads.values(),
                 )
-                table = pyarrow.parquet.read_table(path, filesystem=filesystem)
+            source_tables = dict(zip(source_reads.keys(), tables))
 
-                # Rename columns by the field mapping dictionary if it exists
-                if feature_view.batch_source.field_mapping is not None:
-                    table = _run_field_mapping(
-                        table, feature_view.batch_source.field_mapping
-                    )
-                # Rename entity columns by the join_key_map dictionary if it exists
-                if feature_view.projection.join_key_map:
-                    table = _run_field_mapping(
-                        table, feature_view.projection.join_key_map
-                    )
-
-                # Convert pyarrow table to pandas dataframe. Note, if the underlying data has missing values,
-                # pandas will convert those values to np.nan if the dtypes are numerical (floats, ints, etc.) or boolean
-                # If the dtype is 'object', then missing values are inferred as python `None`s.
-                # More details at:
-                # https://pandas.pydata.org/pandas-docs/stable/user_guide/missing_data.html#values-considered-missing
-                df_to_join = table.to_pandas()
+            # Load feature view data from sources and join them incrementally
+            for feature_view, features in feature_views_to_features.items():
+                batch_source = feature_view.batch_source
+                event_timestamp_column = batch_source.event_timestamp_column
+                created_timestamp_column = batch_source.created_timestamp_column
+                feature_view_name = feature_view.projection.name_to_use()
 
-                # Make sure all timestamp fields are tz-aware. We default tz-naive fields to UTC
-                df_to_join[event_timestamp_column] = df_to_join[
+                join_keys = feature_view_join_keys[feature_view]
+                right_entity_columns = join_keys
+                right_entity_key_columns = [
                     event_timestamp_column
-                ].apply(
-                    lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc)
-                )
-                if created_timestamp_column:
-                    df_to_join[created_timestamp_column] = df_to_join[
-                        created_timestamp_column
-                    ].apply(
-                        lambda x: x
-                        if x.tzinfo is not None
-                        else x.replace(tzinfo=pytz.utc)
-                    )
+                ] + right_entity_columns
 
-                # Sort dataframe by the event timestamp column
-                df_to_join = df_to_join.sort_values(event_timestamp_column)
+                # Select this feature view's columns from the shared source table
+                source_key, columns = feature_view_reads[feature_view]
+                table = source_tables[source_key]
+                table = table.select(list(dict.fromkeys(columns)))
 
                 # Build a list of all the features we should select from this source
                 feature_names = []
+                columns_map = {}
                 for feature in features:
                     # Modify the separator for feature refs in column names to double underscore. We are using
                     # double underscore as separator for consistency with other databases like BigQuery,
                     # where there are very few characters available for use as separators
                     if full_feature_names:
-                        formatted_feature_name = (
-                            f"{feature_view.projection.name_to_use()}__{feature}"
-                        )
+                        formatted_feature_name = f"{feature_view_name}__{feature}"
+                        columns_map[feature] = formatted_feature_name
                     else:
                         formatted_feature_name = feature
                     # Add the feature name to the list of columns
                     feature_names.append(formatted_feature_name)
 
-                    # Ensure that the source dataframe feature column includes the feature view name as a prefix
-                    df_to_join.rename(
-                        columns={feature: formatted_feature_name}, inplace=True,
-                    )
+                # Rename columns in a single pass: first by the field mapping, then entity columns by the
+                # join_key_map, and finally feature columns to include the feature view name as a prefix
+                field_mapping = batch_source.field_mapping or {}
+                join_key_map = feature_view.projection.join_key_map
+                renamed_columns = []
+                for column in table.column_names:
+                    column = field_mapping.get(column, column)
+                    column = join_key_map.get(column, column)
+                    renamed_columns.append(columns_map.get(column, column))
+                table = table.rename_columns(renamed_columns)
 
-                # Build a list of entity columns to join on (from the right table)
-                join_keys = []
-                for entity_name in feature_view.entities:
-                    entity = registry.get_entity(entity_name, project)
-                    join_key = feature_view.projection.join_key_map.get(
-                        entity.join_key, entity.join_key
-                    )
-                    join_keys.append(join_key)
-                right_entity_columns = join_keys
-                right_entity_key_columns = [
-                    event_timestamp_column
-                ] + right_entity_columns
+                # Convert pyarrow table to pandas dataframe. Note, if the underlying data has missing values,
+                # pandas will convert those values to np.nan if the dtypes are numerical (floats, ints, etc.) or boolean
+                # If the dtype is 'object', then missing values are inferred as python `None`s.
+                # More details at:
+                # https://pandas.pydata.org/pandas-docs/stable/user_guide/missing_data.html#values-considered-missing
+                df_to_join = table.to_pandas()
 
-                # Remove all duplicate entity keys (using created timestamp)
-                right_entity_key_sort_columns = right_entity_key_columns
-                if created_timestamp_column:
-                    # If created_timestamp is available, use it to dedupe deterministically
-                    right_entity_key_sort_columns = right_entity_key_sort_columns + [
-                        created_timestamp_column
-                    ]
+                # Feature rows for entities that aren't in the entity dataframe can never be joined,
+                # so drop them before the more expensive sort and point-in-time join
+                df_to_join = _filter_by_join_keys(
+                    df_to_join, entity_df_with_features, join_keys
+                )
 
-                df_to_join.sort_values(by=right_entity_key_sort_columns, inplace=True)
-                df_to_join.drop_duplicates(
-                    right_entity_key_sort_columns,
-                    keep="last",
-                    ignore_index=True,
-                    inplace=True,
+                # Make sure all timestamp fields are tz-aware. We default tz-naive fields to UTC
+                df_to_join[event_timestamp_column] = _normalize_timestamp_to_utc(
+                    df_to_join[event_timestamp_column]
                 )
+                if created_timestamp_column:
+                    df_to_join[created_timestamp_column] = _normalize_timestamp_to_utc(
+                        df_to_join[created_timestamp_column]
+                    )
+
+                # Sort by event timestamp, breaking ties with the created timestamp if
+                # available. merge_asof picks the last matching row for each entity, so
+                # rows sharing an event timestamp resolve to the most recently created
+                # one without a separate de-duplication pass.
+                sort_columns = [event_timestamp_column]
+                if created_timestamp_column:
+                    sort_columns.append(created_timestamp_column)
+                df_to_join.sort_values(by=sort_columns, inplace=True)
 
                 # Select only the columns we need to join from the feature dataframe
                 df_to_join = df_to_join[right_entity_key_columns + feature_names]
 
                 # Do point in-time-join between entity_df and feature dataframe
-                entity_df_with_features = pd.merge_asof(
+                entity_df_with_features = _merge_asof_by_join_keys(
                     entity_df_with_features,
                     df_to_join,
                     left_on=entity_df_event_timestamp_col,
                     right_on=event_timestamp_column,
-                    by=right_entity_columns or None,
+                    join_keys=right_entity_columns,
                     tolerance=feature_view.ttl,
                 )
 
@@ -278,25 +351,31 @@ class FileOfflineStore(OfflineStore):
 
         # Create lazy function that is only called from the RetrievalJob object
         def evaluate_offline_job():
-            filesystem, path = FileSource.create_filesystem_and_path(
-                data_source.path, data_source.file_options.s3_endpoint_override
-            )
-            source_df = pd.read_parquet(path, filesystem=filesystem)
+            try:
+                source_df = _read_parquet_table(
+                    data_source,
+                    join_key_columns
+                    + feature_name_columns
+                    + [event_timestamp_column]
+                    + ([created_timestamp_column] if created_timestamp_column else []),
+                    event_timestamp_column,
+                    start_date=start_date,
+                    end_date=end_date,
+                    end_date_inclusive=False,
+                ).to_pandas()
+            except FileSourceMissingColumns as e:
+                if any(k in e.missing_columns for k in join_key_columns):
+                    raise FeastJoinKeysDuringMaterialization(
+                        data_source.path, set(join_key_columns), set(e.source_columns)
+                    ) from e
+                raise
             # Make sure all timestamp fields are tz-aware. We default tz-naive fields to UTC
-            source_df[event_timestamp_column] = source_df[event_timestamp_column].apply(
-                lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc)
+            source_df[event_timestamp_column] = _normalize_timestamp_to_utc(
+                source_df[event_timestamp_column]
             )
             if created_timestamp_column:
-                source_df[created_timestamp_column] = source_df[
-                    created_timestamp_column
-                ].apply(
-                    lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc)
-                )
-
-            source_columns = set(source_df.columns)
-            if not set(join_key_columns).issubset(source_columns):
-                raise FeastJoinKeysDuringMaterialization(
-                    data_source.path, set(join_key_columns), source_columns
+                source_df[created_timestamp_column] = _normalize_timestamp_to_utc(
+                    source_df[created_timestamp_column]
                 )
 
             ts_columns = (
@@ -307,22 +386,18 @@ class FileOfflineStore(OfflineStore):
 
             source_df.sort_values(by=ts_columns, inplace=True)
 
-            filtered_df = source_df[
-                (source_df[event_timestamp_column] >= start_date)
-                & (source_df[event_timestamp_column] < end_date)
-            ]
-
-            columns_to_extract = set(
-                join_key_columns + feature_name_columns + ts_columns
+            # Rows outside of [start_date, end_date) were already filtered out while reading the source
+            columns_to_extract = list(
+                dict.fromkeys(join_key_columns + feature_name_columns + ts_columns)
             )
             if join_key_columns:
-                last_values_df = filtered_df.drop_duplicates(
+                last_values_df = source_df.drop_duplicates(
                     join_key_columns, keep="last", ignore_index=True
                 )
             else:
-                last_values_df = filtered_df
+                last_values_df = source_df
                 last_values_df[DUMMY_ENTITY_ID] = DUMMY_ENTITY_VAL
-                columns_to_extract.add(DUMMY_ENTITY_ID)
+                columns_to_extract.append(DUMMY_ENTITY_ID)
 
             return last_values_df[columns_to_extract]
 
@@ -332,3 +407,176 @@ class FileOfflineStore(OfflineStore):
             full_feature_names=False,
             on_demand_feature_views=None,
         )
+
+
+def _normalize_timestamp_to_utc(timestamps: pd.Series) -> pd.Series:
+    """
+    Converts a timestamp column to tz-aware UTC timestamps, treating tz-naive timestamps as UTC.
+    Datetime columns are converted with a single vectorized operation instead of per row.
+    """
+    if pd.api.types.is_datetime64tz_dtype(timestamps.dtype):
+        return timestamps.dt.tz_convert("UTC")
+    if pd.api.types.is_datetime64_dtype(timestamps.dtype):
+        return timestamps.dt.tz_localize("UTC")
+    return pd.to_datetime(timestamps, utc=True)
+
+
+def _merge_asof_by_join_keys(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    left_on: str,
+    right_on: str,
+    join_keys: List[str],
+    tolerance: Optional[timedelta],
+) -> pd.DataFrame:
+    """
+    Point-in-time joins the right dataframe onto the left one, matching rows on the given join keys.
+
+    merge_asof only has a fast path for a single numeric "by" column, and otherwise hashes python objects (tuples of
+    values when there are several join keys) for every row. In that case the join keys of both sides are factorized
+    into a single shared integer code, which is joined on instead.
+    """
+    # Integer join keys may differ in width, e.g. hive partition columns are read as int32
+    key_dtypes = {
+        k: left[k].dtype
+        for k in join_keys
+        if left[k].dtype != right[k].dtype
+        and pd.api.types.is_integer_dtype(left[k].dtype)
+        and pd.api.types.is_integer_dtype(right[k].dtype)
+    }
+    if key_dtypes:
+        right = right.astype(key_dtypes)
+    if (
+        not join_keys
+        or (len(join_keys) == 1 and left[join_keys[0]].dtype != object)
+        or any(left[k].dtype != right[k].dtype for k in join_keys)
+    ):
+        return pd.merge_asof(
+            left,
+            right,
+            left_on=left_on,
+            right_on=right_on,
+            by=join_keys or None,
+            tolerance=tolerance,
+        )
+
+    codes = np.zeros(len(left) + len(right), dtype="int64")
+    for join_key in join_keys:
+        key_codes, key_uniques = pd.factorize(
+            np.concatenate([left[join_key].to_numpy(), right[join_key].to_numpy()])
+        )
+        # Missing values get a code of -1, so shift by one to keep them distinct from the first unique value
+        codes, _ = pd.factorize(codes * (len(key_uniques) + 1) + key_codes + 1)
+
+    left[_JOIN_KEY_CODE_COLUMN] = codes[: len(left)]
+    right = right.drop(columns=join_keys)
+    right[_JOIN_KEY_CODE_COLUMN] = codes[len(left) :]
+    try:
+        joined = pd.merge_asof(
+            left,
+            right,
+            left_on=left_on,
+            right_on=right_on,
+            by=_JOIN_KEY_CODE_COLUMN,
+            tolerance=tolerance,
+        )
+    finally:
+        del left[_JOIN_KEY_CODE_COLUMN]
+    del joined[_JOIN_KEY_CODE_COLUMN]
+    return joined
+
+
+def _filter_by_join_keys(
+    df: pd.DataFrame, entity_df: pd.DataFrame, join_keys: List[str]
+) -> pd.DataFrame:
+    """
+    Semi-joins the dataframe with the entity dataframe, keeping only the rows whose join key values appear in it.
+    """
+    if not join_keys:
+        return df
+    if len(join_keys) == 1:
+        join_key = join_keys[0]
+        mask = df[join_key].isin(entity_df[join_key].unique())
+    else:
+        entity_keys = pd.MultiIndex.from_frame(entity_df[join_keys].drop_duplicates())
+        mask = pd.MultiIndex.from_frame(df[join_keys]).isin(entity_keys)
+    return df[mask]
+
+
+def _source_key(data_source: FileSource, event_timestamp_column: str) -> tuple:
+    return (
+        data_source.path,
+        data_source.file_options.s3_endpoint_override,
+        event_timestamp_column,
+    )
+
+
+def _read_parquet_table(
+    data_source: FileSource,
+    columns: List[str],
+    event_timestamp_column: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    end_date_inclusive: bool = True,
+) -> pyarrow.Table:
+    """
+    Reads the given columns of a parquet file source, along with any rows which have an event timestamp within
+    the given bounds. Filters are pushed down to the parquet reader, so that row groups outside the bounds are
+    skipped entirely. Hive style partition directories (e.g. driver_id=1001/) are read as columns.
+    """
+    filesystem, path = FileSource.create_filesystem_and_path(
+        data_source.path, data_source.file_options.s3_endpoint_override
+    )
+    dataset = pyarrow.dataset.dataset(
+        path, filesystem=filesystem, format="parquet", partitioning="hive"
+    )
+    schema = dataset.schema
+    columns = list(dict.fromkeys(columns))
+    missing_columns = [c for c in columns if c not in schema.names]
+    if missing_columns:
+        raise FileSourceMissingColumns(data_source.path, missing_columns, schema.names)
+
+    filter_expression = None
+    if event_timestamp_column in schema.names:
+        # Bounds need to have the same type as the column, e.g. tz-naive columns are compared as UTC
+        timestamp_type = schema.field(event_timestamp_column).type
+        timestamp_field = pyarrow.dataset.field(event_timestamp_column)
+        bounds = []
+        if start_date is not None:
+            bounds.append(
+                timestamp_field
+                >= _timestamp_bound(start_date, timestamp_type, round_up=True)
+            )
+        if end_date is not None:
+            if end_date_inclusive:
+                bounds.append(
+                    timestamp_field
+                    <= _timestamp_bound(end_date, timestamp_type, round_up=False)
+                )
+            else:
+                bounds.append(
+                    timestamp_field
+                    < _timestamp_bound(end_date, timestamp_type, round_up=True)
+                )
+        for bound in bounds:
+            filter_expression = (
+                bound if filter_expression is None else filter_expression & bound
+            )
+
+    return dataset.to_table(columns=columns, filter=filter_expression)
+
+
+def _timestamp_bound(
+    date: datetime, timestamp_type: pyarrow.DataType, round_up: bool
+) -> pyarrow.Scalar:
+    """
+    Converts a bound on an event timestamp column to the type of the column. Timestamp columns often have a coarser
+    unit than the bound (e.g. milliseconds), so the bound is rounded to a whole unit in the direction that keeps the
+    comparison exact, rather than truncated.
+    """
+    if not pyarrow.types.is_timestamp(timestamp_type):
+        return pyarrow.scalar(date, type=timestamp_type)
+    unit_nanos = _TIMESTAMP_UNIT_NANOS[timestamp_type.unit]
+    nanos = pd.Timestamp(date).value
+    units = -(-nanos // unit_nanos) if round_up else nanos // unit_nanos
+    return pyarrow.scalar(units, type=timestamp_type)
@@ -250,11 +250,10 @@ class DatastoreOnlineStore(OnlineStore):
         for key in keys:
             if key in values_dict:
                 value = values_dict[key]
-                res = {}
-                for feature_name, value_bin in value["values"].items():
-                    val = ValueProto()
-                    val.ParseFromString(value_bin)
-                    res[feature_name] = val
+                res = {
+                    feature_name: ValueProto.FromString(value_bin)
+                    for feature_name, value_bin in value["values"].items()
+                }
                 result.append((value["event_ts"], res))
             else:
                 result.append((None, None))
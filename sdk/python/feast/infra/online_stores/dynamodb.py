@@ -11,27 +11,70 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
+import itertools
+import random
+import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from multiprocessing.pool import ThreadPool
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from pydantic import StrictStr
+from pydantic import PositiveInt, StrictStr, conint
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureTable, FeatureView, utils
-from feast.infra.online_stores.helpers import compute_entity_id
+from feast.errors import DynamoDBTableSchemaMismatch, DynamoDBUnprocessedItemsError
+from feast.infra.online_stores.helpers import compute_binary_entity_id
 from feast.infra.online_stores.online_store import OnlineStore
+from feast.protos.feast.storage.DynamoDB_pb2 import (
+    DynamoDBFeatureValues as DynamoDBFeatureValuesProto,
+)
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import FeastConfigBaseModel, RepoConfig
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError as e:
     from feast.errors import FeastExtrasDependencyImportError
 
     raise FeastExtrasDependencyImportError("aws", str(e))
 
+# Feature rows are keyed on the binary entity id.
+_TABLE_KEY_SCHEMA = [{"AttributeName": "entity_id", "KeyType": "HASH"}]
+_TABLE_ATTRIBUTE_DEFINITIONS = [{"AttributeName": "entity_id", "AttributeType": "B"}]
+
+# BatchWriteItem accepts at most 25 put requests per call.
+_WRITE_BATCH_SIZE = 25
+
+# New tables usually become active within seconds, so poll much more often than the
+# waiter's default of every 20 seconds.
+_TABLE_WAITER_CONFIG = {"Delay": 2, "MaxAttempts": 30}
+
+# Maximum amount of entity ids memoized for online reads.
+_ENTITY_ID_CACHE_SIZE = 100_000
+
+# Throttled requests are retried by botocore with client side rate limiting. Items that
+# DynamoDB leaves unprocessed in batch requests are retried by us, with jittered
+# exponential backoff.
+_CLIENT_RETRY_CONFIG = {"mode": "adaptive", "max_attempts": 10}
+_BASE_BACKOFF_SECONDS = 0.05
+_MAX_BACKOFF_SECONDS = 5.0
+_MAX_BATCH_ATTEMPTS = 10
+
 
 class DynamoDBOnlineStoreConfig(FeastConfigBaseModel):
     """Online store config for DynamoDB store"""
@@ -42,12 +85,25 @@ class DynamoDBOnlineStoreConfig(FeastConfigBaseModel):
     region: StrictStr
     """ AWS Region Name """
 
+    dax_endpoint_url: Optional[StrictStr] = None
+    """ (optional) DynamoDB Accelerator (DAX) cluster endpoint used to read and write feature rows,
+    e.g. dax://my-cluster.abc123.dax-clusters.us-west-2.amazonaws.com """
+
+    write_concurrency: PositiveInt = 32
+    """ (optional) Amount of threads to use when writing batches of feature rows into DynamoDB """
+
+    read_batch_size: conint(gt=0, le=100) = 100  # type: ignore
+    """ (optional) Amount of entity keys per BatchGetItem request (at most 100) """
+
 
 class DynamoDBOnlineStore(OnlineStore):
     """
     Online feature store for AWS DynamoDB.
     """
 
+    _dynamodb_client = None
+    _dax_client = None
+
     def update(
         self,
         config: RepoConfig,
@@ -59,31 +115,30 @@ class DynamoDBOnlineStore(OnlineStore):
     ):
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        dynamodb_client, dynamodb_resource = self._initialize_dynamodb(online_config)
+        dynamodb_client = self._get_dynamodb_client(online_config.region)
 
-        for table_instance in tables_to_keep:
-            try:
-                dynamodb_resource.create_table(
-                    TableName=f"{config.project}.{table_instance.name}",
-                    KeySchema=[{"AttributeName": "entity_id", "KeyType": "HASH"}],
-                    AttributeDefinitions=[
-                        {"AttributeName": "entity_id", "AttributeType": "S"}
-                    ],
-                    BillingMode="PAY_PER_REQUEST",
+        table_names = [
+            f"{config.project}.{table_instance.name}"
+            for table_instance in tables_to_keep
+        ]
+        # Issue all table creations up front so that they overlap, and only then wait
+        # for the tables to become active.
+        if table_names:
+            with ThreadPool(
+                processes=min(len(table_names), online_config.write_concurrency)
+            ) as pool:
+                pool.map(
+                    lambda table_name: _create_table_idempotent(
+                        dynamodb_client, table_name
+                    ),
+                    table_names,
                 )
-            except ClientError as ce:
-                # If the table creation fails with ResourceInUseException,
-                # it means the table already exists or is being created.
-                # Otherwise, re-raise the exception
-                if ce.response["Error"]["Code"] != "ResourceInUseException":
-                    raise
 
-        for table_instance in tables_to_keep:
-            dynamodb_client.get_waiter("table_exists").wait(
-                TableName=f"{config.project}.{table_instance.name}"
-            )
+        waiter = dynamodb_client.get_waiter("table_exists")
+        for table_name in table_names:
+            waiter.wait(TableName=table_name, WaiterConfig=_TABLE_WAITER_CONFIG)
 
-        self._delete_tables_idempotent(dynamodb_resource, config, tables_to_delete)
+        self._delete_tables_idempotent(dynamodb_client, config, tables_to_delete)
 
     def teardown(
         self,
@@ -93,9 +148,9 @@ class DynamoDBOnlineStore(OnlineStore):
     ):
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        _, dynamodb_resource = self._initialize_dynamodb(online_config)
+        dynamodb_client = self._get_dynamodb_client(online_config.region)
 
-        self._delete_tables_idempotent(dynamodb_resource, config, tables)
+        self._delete_tables_idempotent(dynamodb_client, config, tables)
 
     def online_write_batch(
         self,
@@ -108,24 +163,46 @@ class DynamoDBOnlineStore(OnlineStore):
     ) -> None:
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        _, dynamodb_resource = self._initialize_dynamodb(online_config)
-
-        table_instance = dynamodb_resource.Table(f"{config.project}.{table.name}")
-        with table_instance.batch_writer() as batch:
-            for entity_key, features, timestamp, created_ts in data:
-                entity_id = compute_entity_id(entity_key)
-                batch.put_item(
-                    Item={
-                        "entity_id": entity_id,  # PartitionKey
-                        "event_ts": str(utils.make_tzaware(timestamp)),
-                        "values": {
-                            k: v.SerializeToString()
-                            for k, v in features.items()  # Serialized Features
-                        },
-                    }
-                )
-                if progress:
-                    progress(1)
+        dynamodb_client = self._get_dynamodb_data_client(online_config)
+
+        table_name = f"{config.project}.{table.name}"
+        # Later rows for the same entity overwrite earlier ones, as they would with
+        # sequential writes. This also keeps duplicate keys out of a single request.
+        items: Dict[bytes, Dict[str, Any]] = {}
+        # Materialized rows usually share a handful of event timestamps, so format
+        # each distinct timestamp only once.
+        event_ts_strs: Dict[datetime, str] = {}
+        for entity_key, features, timestamp, created_ts in data:
+            event_ts = event_ts_strs.get(timestamp)
+            if event_ts is None:
+                event_ts = event_ts_strs[timestamp] = str(utils.make_tzaware(timestamp))
+            entity_id = compute_binary_entity_id(entity_key)
+            # Items are built in the low level client's attribute value format,
+            # which skips the resource's per-attribute type inference.
+            items[entity_id] = {
+                "entity_id": {"B": entity_id},  # PartitionKey
+                "event_ts": {"S": event_ts},
+                "values": {
+                    "B": DynamoDBFeatureValuesProto(
+                        values=features
+                    ).SerializeToString()  # Serialized Features
+                },
+            }
+        if progress and len(items) < len(data):
+            progress(len(data) - len(items))
+
+        batches = list(_to_minibatches(items.values(), batch_size=_WRITE_BATCH_SIZE))
+        write_batch = functools.partial(
+            _batch_write_items, dynamodb_client, table_name, progress=progress
+        )
+        # Small writes (e.g. pushing a few rows) don't need a thread pool.
+        if len(batches) == 1:
+            write_batch(batches[0])
+        elif batches:
+            with ThreadPool(
+                processes=min(online_config.write_concurrency, len(batches))
+            ) as pool:
+                pool.map(write_batch, batches)
 
     def online_read(
         self,
@@ -136,47 +213,198 @@ class DynamoDBOnlineStore(OnlineStore):
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        _, dynamodb_resource = self._initialize_dynamodb(online_config)
+        dynamodb_client = self._get_dynamodb_data_client(online_config)
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
-        for entity_key in entity_keys:
-            table_instance = dynamodb_resource.Table(f"{config.project}.{table.name}")
-            entity_id = compute_entity_id(entity_key)
-            response = table_instance.get_item(Key={"entity_id": entity_id})
-            value = response.get("Item")
+        table_name = f"{config.project}.{table.name}"
+        entity_ids = [
+            _cached_binary_entity_id(entity_key.SerializeToString())
+            for entity_key in entity_keys
+        ]
 
+        # BatchGetItem rejects duplicate keys and doesn't return items in request order,
+        # so we fetch every distinct entity id once and index the items by entity id.
+        items: Dict[bytes, Dict[str, Any]] = {}
+        for batch in _to_minibatches(
+            dict.fromkeys(entity_ids), batch_size=online_config.read_batch_size
+        ):
+            items.update(_batch_get_items(dynamodb_client, table_name, batch))
+
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        for entity_id in entity_ids:
+            value = items.get(entity_id)
             if value is not None:
-                res = {}
-                for feature_name, value_bin in value["values"].items():
-                    val = ValueProto()
-                    val.ParseFromString(value_bin.value)
-                    res[feature_name] = val
-                result.append((value["event_ts"], res))
+                res = dict(
+                    DynamoDBFeatureValuesProto.FromString(value["values"]["B"]).values
+                )
+                result.append((value["event_ts"]["S"], res))
             else:
                 result.append((None, None))
         return result
 
-    def _initialize_dynamodb(self, online_config: DynamoDBOnlineStoreConfig):
-        return (
-            boto3.client("dynamodb", region_name=online_config.region),
-            boto3.resource("dynamodb", region_name=online_config.region),
-        )
+    def _get_dynamodb_client(self, region: str):
+        if self._dynamodb_client is None:
+            self._dynamodb_client = _initialize_dynamodb_client(region)
+        return self._dynamodb_client
+
+    def _get_dynamodb_data_client(self, online_config: DynamoDBOnlineStoreConfig):
+        """
+        Returns the client used to read and write feature rows. This is the DAX
+        client if a DAX endpoint is configured, and the DynamoDB client otherwise.
+        """
+        if online_config.dax_endpoint_url is None:
+            return self._get_dynamodb_client(online_config.region)
+        if self._dax_client is None:
+            self._dax_client = _initialize_dax_client(
+                online_config.region, online_config.dax_endpoint_url
+            )
+        return self._dax_client
 
     def _delete_tables_idempotent(
         self,
-        dynamodb_resource,
+        dynamodb_client,
         config: RepoConfig,
         tables: Sequence[Union[FeatureTable, FeatureView]],
     ):
         for table_instance in tables:
             try:
-                table = dynamodb_resource.Table(
-                    f"{config.project}.{table_instance.name}"
+                dynamodb_client.delete_table(
+                    TableName=f"{config.project}.{table_instance.name}"
                 )
-                table.delete()
             except ClientError as ce:
                 # If the table deletion fails with ResourceNotFoundException,
                 # it means the table has already been deleted.
                 # Otherwise, re-raise the exception
-                if ce.response["Error"]["Code"] != "ResourceNotFoundException":
+                if _error_code(ce) != "ResourceNotFoundException":
                     raise
+
+
+def _initialize_dynamodb_client(region: str):
+    return boto3.client(
+        "dynamodb", region_name=region, config=Config(retries=_CLIENT_RETRY_CONFIG)
+    )
+
+
+def _initialize_dax_client(region: str, dax_endpoint_url: str):
+    # DAX only serves data plane operations, so tables are still managed through
+    # the regular DynamoDB client.
+    try:
+        from amazondax import AmazonDaxClient
+    except ImportError as e:
+        from feast.errors import FeastExtrasDependencyImportError
+
+        raise FeastExtrasDependencyImportError("dax", str(e))
+
+    return AmazonDaxClient(endpoint_url=dax_endpoint_url, region_name=region)
+
+
+@functools.lru_cache(maxsize=_ENTITY_ID_CACHE_SIZE)
+def _cached_binary_entity_id(serialized_entity_key: bytes) -> bytes:
+    """
+    Compute the entity id of a serialized EntityKey proto. Serving reads the same
+    entities for every feature view they request, so the ids are memoized.
+    """
+    return compute_binary_entity_id(EntityKeyProto.FromString(serialized_entity_key))
+
+
+def _create_table_idempotent(dynamodb_client, table_name: str):
+    try:
+        dynamodb_client.create_table(
+            TableName=table_name,
+            KeySchema=_TABLE_KEY_SCHEMA,
+            AttributeDefinitions=_TABLE_ATTRIBUTE_DEFINITIONS,
+            BillingMode="PAY_PER_REQUEST",
+        )
+    except ClientError as ce:
+        # If the table creation fails with ResourceInUseException,
+        # it means the table already exists or is being created.
+        # Otherwise, re-raise the exception
+        if _error_code(ce) != "ResourceInUseException":
+            raise
+        _check_table_schema(dynamodb_client, table_name)
+
+
+def _check_table_schema(dynamodb_client, table_name: str):
+    """
+    Check that an existing table is keyed the way this version of Feast reads and
+    writes it. Tables created before entity ids were stored as binary keys are
+    rejected, since every read and write against them would fail.
+    """
+    table = dynamodb_client.describe_table(TableName=table_name)["Table"]
+    attribute_definitions = [
+        attribute
+        for attribute in table["AttributeDefinitions"]
+        if attribute["AttributeName"] == "entity_id"
+    ]
+    if (
+        table["KeySchema"] != _TABLE_KEY_SCHEMA
+        or attribute_definitions != _TABLE_ATTRIBUTE_DEFINITIONS
+    ):
+        raise DynamoDBTableSchemaMismatch(table_name)
+
+
+def _error_code(ce: ClientError) -> Optional[str]:
+    return (ce.response or {}).get("Error", {}).get("Code")
+
+
+def _batch_get_items(
+    dynamodb_client, table_name: str, entity_ids: List[bytes]
+) -> Dict[bytes, Dict[str, Any]]:
+    """
+    Fetch the items for the given entity ids with BatchGetItem, retrying any unprocessed
+    keys with exponential backoff.
+    """
+    items: Dict[bytes, Dict[str, Any]] = {}
+    request_items = {
+        table_name: {"Keys": [{"entity_id": {"B": e}} for e in entity_ids]}
+    }
+    attempt = 0
+    while request_items:
+        if attempt == _MAX_BATCH_ATTEMPTS:
+            raise DynamoDBUnprocessedItemsError(table_name, "BatchGetItem", attempt)
+        if attempt > 0:
+            time.sleep(_backoff_delay(attempt))
+        response = dynamodb_client.batch_get_item(RequestItems=request_items)
+        for item in response["Responses"].get(table_name, []):
+            items[item["entity_id"]["B"]] = item
+        request_items = response.get("UnprocessedKeys")
+        attempt += 1
+    return items
+
+
+def _batch_write_items(
+    dynamodb_client,
+    table_name: str,
+    items: List[Dict[str, Any]],
+    progress: Optional[Callable[[int], Any]],
+):
+    """
+    Write the given items with BatchWriteItem, retrying any unprocessed items with
+    exponential backoff.
+    """
+    request_items = {table_name: [{"PutRequest": {"Item": item}} for item in items]}
+    attempt = 0
+    while request_items:
+        if attempt == _MAX_BATCH_ATTEMPTS:
+            raise DynamoDBUnprocessedItemsError(table_name, "BatchWriteItem", attempt)
+        if attempt > 0:
+            time.sleep(_backoff_delay(attempt))
+        response = dynamodb_client.batch_write_item(RequestItems=request_items)
+        request_items = response.get("UnprocessedItems")
+        attempt += 1
+
+    if progress:
+        progress(len(items))
+
+
+def _to_minibatches(iterable: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            break
+        yield batch
+
+
+def _backoff_delay(attempt: int) -> float:
+    delay = min(_MAX_BACKOFF_SECONDS, _BASE_BACKOFF_SECONDS * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
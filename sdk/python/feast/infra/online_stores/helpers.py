@@ -64,4 +64,12 @@ def compute_entity_id(entity_key: EntityKeyProto) -> str:
     Remember that Entity here refers to `EntityKeyProto` which is used in some online stores to encode the keys.
     It has nothing to do with the Entity concept we have in Feast.
     """
-    return mmh3.hash_bytes(serialize_entity_key(entity_key)).hex()
+    return compute_binary_entity_id(entity_key).hex()
+
+
+def compute_binary_entity_id(entity_key: EntityKeyProto) -> bytes:
+    """
+    Compute the raw 16 byte Entity id given Feast Entity Key, for online stores that can
+    store binary keys. This is half the size of the hex encoded `compute_entity_id`.
+    """
+    return mmh3.hash_bytes(serialize_entity_key(entity_key))
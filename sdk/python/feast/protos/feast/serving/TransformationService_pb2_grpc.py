@@ -0,0 +1,99 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from feast.protos.feast.serving import TransformationService_pb2 as feast_dot_serving_dot_TransformationService__pb2
+
+
+class TransformationServiceStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetTransformationServiceInfo = channel.unary_unary(
+                '/feast.serving.TransformationService/GetTransformationServiceInfo',
+                request_serializer=feast_dot_serving_dot_TransformationService__pb2.GetTransformationServiceInfoRequest.SerializeToString,
+                response_deserializer=feast_dot_serving_dot_TransformationService__pb2.GetTransformationServiceInfoResponse.FromString,
+                )
+        self.TransformFeatures = channel.unary_unary(
+                '/feast.serving.TransformationService/TransformFeatures',
+                request_serializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesRequest.SerializeToString,
+                response_deserializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesResponse.FromString,
+                )
+
+
+class TransformationServiceServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def GetTransformationServiceInfo(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def TransformFeatures(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_TransformationServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetTransformationServiceInfo': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetTransformationServiceInfo,
+                    request_deserializer=feast_dot_serving_dot_TransformationService__pb2.GetTransformationServiceInfoRequest.FromString,
+                    response_serializer=feast_dot_serving_dot_TransformationService__pb2.GetTransformationServiceInfoResponse.SerializeToString,
+            ),
+            'TransformFeatures': grpc.unary_unary_rpc_method_handler(
+                    servicer.TransformFeatures,
+                    request_deserializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesRequest.FromString,
+                    response_serializer=feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'feast.serving.TransformationService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class TransformationService(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetTransformationServiceInfo(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/feast.serving.TransformationService/GetTransformationServiceInfo',
+            feast_dot_serving_dot_TransformationService__pb2.GetTransformationServiceInfoRequest.SerializeToString,
+            feast_dot_serving_dot_TransformationService__pb2.GetTransformationServiceInfoResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def TransformFeatures(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/feast.serving.TransformationService/TransformFeatures',
+            feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesRequest.SerializeToString,
+            feast_dot_serving_dot_TransformationService__pb2.TransformFeaturesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: feast/storage/DynamoDB.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from feast.protos.feast.types import Value_pb2 as feast_dot_types_dot_Value__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='feast/storage/DynamoDB.proto',
+  package='feast.storage',
+  syntax='proto3',
+  serialized_options=b'\n\023feast.proto.storageB\rDynamoDBProtoZ6github.com/feast-dev/feast/sdk/go/protos/feast/storage',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x1c\x66\x65\x61st/storage/DynamoDB.proto\x12\rfeast.storage\x1a\x17\x66\x65\x61st/types/Value.proto\"\x9c\x01\n\x15\x44ynamoDBFeatureValues\x12@\n\x06values\x18\x01 \x03(\x0b\x32\x30.feast.storage.DynamoDBFeatureValues.ValuesEntry\x1a\x41\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.feast.types.Value:\x02\x38\x01\x42\\\n\x13\x66\x65\x61st.proto.storageB\rDynamoDBProtoZ6github.com/feast-dev/feast/sdk/go/protos/feast/storageb\x06proto3'
+  ,
+  dependencies=[feast_dot_types_dot_Value__pb2.DESCRIPTOR,])
+
+
+
+
+_DYNAMODBFEATUREVALUES_VALUESENTRY = _descriptor.Descriptor(
+  name='ValuesEntry',
+  full_name='feast.storage.DynamoDBFeatureValues.ValuesEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='feast.storage.DynamoDBFeatureValues.ValuesEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='feast.storage.DynamoDBFeatureValues.ValuesEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=164,
+  serialized_end=229,
+)
+
+_DYNAMODBFEATUREVALUES = _descriptor.Descriptor(
+  name='DynamoDBFeatureValues',
+  full_name='feast.storage.DynamoDBFeatureValues',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='values', full_name='feast.storage.DynamoDBFeatureValues.values', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_DYNAMODBFEATUREVALUES_VALUESENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=73,
+  serialized_end=229,
+)
+
+_DYNAMODBFEATUREVALUES_VALUESENTRY.fields_by_name['value'].message_type = feast_dot_types_dot_Value__pb2._VALUE
+_DYNAMODBFEATUREVALUES_VALUESENTRY.containing_type = _DYNAMODBFEATUREVALUES
+_DYNAMODBFEATUREVALUES.fields_by_name['values'].message_type = _DYNAMODBFEATUREVALUES_VALUESENTRY
+DESCRIPTOR.message_types_by_name['DynamoDBFeatureValues'] = _DYNAMODBFEATUREVALUES
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+DynamoDBFeatureValues = _reflection.GeneratedProtocolMessageType('DynamoDBFeatureValues', (_message.Message,), {
+
+  'ValuesEntry' : _reflection.GeneratedProtocolMessageType('ValuesEntry', (_message.Message,), {
+    'DESCRIPTOR' : _DYNAMODBFEATUREVALUES_VALUESENTRY,
+    '__module__' : 'feast.storage.DynamoDB_pb2'
+    # @@protoc_insertion_point(class_scope:feast.storage.DynamoDBFeatureValues.ValuesEntry)
+    })
+  ,
+  'DESCRIPTOR' : _DYNAMODBFEATUREVALUES,
+  '__module__' : 'feast.storage.DynamoDB_pb2'
+  # @@protoc_insertion_point(class_scope:feast.storage.DynamoDBFeatureValues)
+  })
+_sym_db.RegisterMessage(DynamoDBFeatureValues)
+_sym_db.RegisterMessage(DynamoDBFeatureValues.ValuesEntry)
+
+
+DESCRIPTOR._options = None
+_DYNAMODBFEATUREVALUES_VALUESENTRY._options = None
+# @@protoc_insertion_point(module_scope)
@@ -82,6 +82,11 @@ AWS_REQUIRED = [
     "docker>=5.0.2",
 ]
 
+# Only needed to serve DynamoDB online features through DAX
+DAX_REQUIRED = AWS_REQUIRED + [
+    "amazon-dax-client>=1.1.7",
+]
+
 CI_REQUIRED = [
     "cryptography==3.3.2",
     "flake8",
@@ -118,6 +123,7 @@ CI_REQUIRED = [
     "google-cloud-storage>=1.20.*,<1.41",
     "google-cloud-core==1.4.*",
     "redis-py-cluster==2.1.2",
+    "amazon-dax-client>=1.1.7",
     "boto3==1.17.*",
 ]
 
@@ -217,6 +223,7 @@ setup(
         "ci": CI_REQUIRED,
         "gcp": GCP_REQUIRED,
         "aws": AWS_REQUIRED,
+        "dax": DAX_REQUIRED,
         "redis": REDIS_REQUIRED,
     },
     include_package_data=True,
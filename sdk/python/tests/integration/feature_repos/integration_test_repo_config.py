@@ -1,3 +1,4 @@
+import importlib
 from dataclasses import dataclass
 from typing import Dict, Type, Union
 
@@ -18,16 +19,29 @@ class IntegrationTestRepoConfig:
     provider: str = "local"
     online_store: Union[str, Dict] = "sqlite"
 
-    offline_store_creator: Type[DataSourceCreator] = FileDataSourceCreator
+    # Either a DataSourceCreator class, or its fully qualified name. Names are only imported when the creator is
+    # needed, so that cloud SDKs aren't loaded for test runs that don't use them.
+    offline_store_creator: Union[str, Type[DataSourceCreator]] = FileDataSourceCreator
 
     full_feature_names: bool = True
     infer_features: bool = False
 
+    def get_offline_store_creator(self) -> Type[DataSourceCreator]:
+        if isinstance(self.offline_store_creator, str):
+            module_name, class_name = self.offline_store_creator.rsplit(".", 1)
+            return getattr(importlib.import_module(module_name), class_name)
+        return self.offline_store_creator
+
     def __repr__(self) -> str:
+        offline_store_creator_name = (
+            self.offline_store_creator
+            if isinstance(self.offline_store_creator, str)
+            else self.offline_store_creator.__name__
+        )
         return "-".join(
             [
                 f"Provider: {self.provider}",
-                f"{self.offline_store_creator.__name__.split('.')[-1].rstrip('DataSourceCreator')}",
+                f"{offline_store_creator_name.split('.')[-1].rstrip('DataSourceCreator')}",
                 self.online_store
                 if isinstance(self.online_store, str)
                 else self.online_store["type"],
@@ -1,17 +1,33 @@
+import functools
+import hashlib
 import importlib
+import inspect
 import os
+import shutil
 import tempfile
-import uuid
+import warnings
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
-from feast import FeatureStore, FeatureView, RepoConfig, driver_test_data
-from feast.constants import FULL_REPO_CONFIGS_MODULE_ENV_NAME
+from feast import (
+    BigQuerySource,
+    FeatureStore,
+    FeatureView,
+    RedshiftSource,
+    RepoConfig,
+    driver_test_data,
+)
+from feast.constants import (
+    FULL_REPO_CONFIGS_MODULE_ENV_NAME,
+    FULL_REPO_CONFIGS_PROVIDERS_ENV_NAME,
+    TEST_DATASET_CACHE_DIR_ENV_NAME,
+)
 from feast.data_source import DataSource
 from tests.integration.feature_repos.integration_test_repo_config import (
     IntegrationTestRepoConfig,
@@ -19,12 +35,6 @@ from tests.integration.feature_repos.integration_test_repo_config import (
 from tests.integration.feature_repos.universal.data_source_creator import (
     DataSourceCreator,
 )
-from tests.integration.feature_repos.universal.data_sources.bigquery import (
-    BigQueryDataSourceCreator,
-)
-from tests.integration.feature_repos.universal.data_sources.redshift import (
-    RedshiftDataSourceCreator,
-)
 from tests.integration.feature_repos.universal.feature_views import (
     conv_rate_plus_100_feature_view,
     create_conv_rate_request_data_source,
@@ -39,13 +49,19 @@ from tests.integration.feature_repos.universal.feature_views import (
 DYNAMO_CONFIG = {"type": "dynamodb", "region": "us-west-2"}
 REDIS_CONFIG = {"type": "redis", "connection_string": "localhost:6379,db=0"}
 
+# Cloud data source creators are referenced by name, so that their SDKs are only imported when they're used
+BIGQUERY_DATA_SOURCE_CREATOR = "tests.integration.feature_repos.universal.data_sources.bigquery.BigQueryDataSourceCreator"
+REDSHIFT_DATA_SOURCE_CREATOR = "tests.integration.feature_repos.universal.data_sources.redshift.RedshiftDataSourceCreator"
+
 # FULL_REPO_CONFIGS contains the repo configurations (e.g. provider, offline store,
 # online store, test data, and more parameters) that most integration tests will test
 # against. By default, FULL_REPO_CONFIGS uses the three providers (local, GCP, and AWS)
 # with their default offline and online stores; it also tests the providers with the
 # Redis online store. It can be overwritten by specifying a Python module through the
 # FULL_REPO_CONFIGS_MODULE_ENV_NAME environment variable. In this case, that Python
-# module will be imported and FULL_REPO_CONFIGS will be extracted from the file.
+# module will be imported and FULL_REPO_CONFIGS will be extracted from the file. Either
+# way, the configurations can be restricted to some providers by listing them (e.g.
+# "local,aws") in the FULL_REPO_CONFIGS_PROVIDERS_ENV_NAME environment variable.
 DEFAULT_FULL_REPO_CONFIGS: List[IntegrationTestRepoConfig] = [
     # Local configurations
     IntegrationTestRepoConfig(),
@@ -53,47 +69,110 @@ DEFAULT_FULL_REPO_CONFIGS: List[IntegrationTestRepoConfig] = [
     # GCP configurations
     IntegrationTestRepoConfig(
         provider="gcp",
-        offline_store_creator=BigQueryDataSourceCreator,
+        offline_store_creator=BIGQUERY_DATA_SOURCE_CREATOR,
         online_store="datastore",
     ),
     IntegrationTestRepoConfig(
         provider="gcp",
-        offline_store_creator=BigQueryDataSourceCreator,
+        offline_store_creator=BIGQUERY_DATA_SOURCE_CREATOR,
         online_store=REDIS_CONFIG,
     ),
     # AWS configurations
     IntegrationTestRepoConfig(
         provider="aws",
-        offline_store_creator=RedshiftDataSourceCreator,
+        offline_store_creator=REDSHIFT_DATA_SOURCE_CREATOR,
         online_store=DYNAMO_CONFIG,
     ),
     IntegrationTestRepoConfig(
         provider="aws",
-        offline_store_creator=RedshiftDataSourceCreator,
+        offline_store_creator=REDSHIFT_DATA_SOURCE_CREATOR,
         online_store=REDIS_CONFIG,
     ),
 ]
+FULL_REPO_CONFIGS = DEFAULT_FULL_REPO_CONFIGS
 full_repo_configs_module = os.environ.get(FULL_REPO_CONFIGS_MODULE_ENV_NAME)
 if full_repo_configs_module is not None:
     try:
         module = importlib.import_module(full_repo_configs_module)
         FULL_REPO_CONFIGS = getattr(module, "FULL_REPO_CONFIGS")
-    except Exception:
-        FULL_REPO_CONFIGS = DEFAULT_FULL_REPO_CONFIGS
-else:
-    FULL_REPO_CONFIGS = DEFAULT_FULL_REPO_CONFIGS
+    except (ImportError, AttributeError) as e:
+        warnings.warn(
+            f"Could not load FULL_REPO_CONFIGS from {full_repo_configs_module}, "
+            f"falling back to DEFAULT_FULL_REPO_CONFIGS: {e}"
+        )
+full_repo_configs_providers = os.environ.get(FULL_REPO_CONFIGS_PROVIDERS_ENV_NAME)
+if full_repo_configs_providers:
+    providers = {p.strip() for p in full_repo_configs_providers.split(",")}
+    FULL_REPO_CONFIGS = [c for c in FULL_REPO_CONFIGS if c.provider in providers]
+
+
+# Columns of the orders dataset that make up the entity dataframe of the universal tests
+UNIVERSAL_ENTITY_COLUMNS = (
+    "customer_id",
+    "driver_id",
+    "order_id",
+    "origin_id",
+    "destination_id",
+    "event_timestamp",
+)
+
+
+UNIVERSAL_ENTITIES: Dict[str, Tuple[Any, ...]] = {
+    "customer": tuple(range(1001, 1020)),
+    "driver": tuple(range(5001, 5020)),
+    "location": tuple(range(1, 50)),
+}
 
 
 def construct_universal_entities() -> Dict[str, List[Any]]:
-    return {
-        "customer": list(range(1001, 1020)),
-        "driver": list(range(5001, 5020)),
-        "location": list(range(1, 50)),
-    }
+    return {name: list(values) for name, values in UNIVERSAL_ENTITIES.items()}
 
 
 def construct_universal_datasets(
     entities: Dict[str, List[Any]], start_time: datetime, end_time: datetime
+) -> Dict[str, pd.DataFrame]:
+    datasets = _construct_universal_datasets(
+        tuple((name, tuple(values)) for name, values in entities.items()),
+        start_time,
+        end_time,
+    )
+    # The generated datasets are shared between callers, so hand out copies that tests can modify freely
+    return {name: df.copy() for name, df in datasets.items()}
+
+
+@functools.lru_cache(maxsize=4)
+def _construct_universal_datasets(
+    entities_key: Tuple[Tuple[str, Tuple[Any, ...]], ...],
+    start_time: datetime,
+    end_time: datetime,
+) -> Dict[str, pd.DataFrame]:
+    # Generated datasets can also be cached on disk, by pointing TEST_DATASET_CACHE_DIR_ENV_NAME at a directory. Other
+    # test processes (e.g. pytest-xdist workers) and reruns can then load them instead of generating them again. The
+    # cache key covers the source of driver_test_data, so that changes to the generators invalidate it. Frames are
+    # pickled rather than written as parquet, since some columns intentionally mix timestamps from different time zones.
+    cache_root = os.environ.get(TEST_DATASET_CACHE_DIR_ENV_NAME)
+    cache_dir = None
+    datasets = None
+    if cache_root:
+        key_hash = hashlib.blake2b(
+            repr((entities_key, start_time.isoformat(), end_time.isoformat())).encode()
+            + inspect.getsource(driver_test_data).encode(),
+            digest_size=16,
+        ).hexdigest()
+        cache_dir = Path(cache_root) / DATASET_CACHE_SUBDIR / key_hash
+        datasets = _read_dataset_cache(cache_dir)
+    if datasets is None:
+        entities = {name: list(values) for name, values in entities_key}
+        datasets = _generate_universal_datasets(entities, start_time, end_time)
+        if cache_dir is not None:
+            _write_dataset_cache(cache_dir, datasets)
+
+    datasets["entity"] = datasets["orders"].loc[:, list(UNIVERSAL_ENTITY_COLUMNS)]
+    return datasets
+
+
+def _generate_universal_datasets(
+    entities: Dict[str, List[Any]], start_time: datetime, end_time: datetime
 ) -> Dict[str, pd.DataFrame]:
     customer_df = driver_test_data.create_customer_daily_profile_df(
         entities["customer"], start_time, end_time
@@ -113,16 +192,6 @@ def construct_universal_datasets(
         order_count=20,
     )
     global_df = driver_test_data.create_global_daily_stats_df(start_time, end_time)
-    entity_df = orders_df[
-        [
-            "customer_id",
-            "driver_id",
-            "order_id",
-            "origin_id",
-            "destination_id",
-            "event_timestamp",
-        ]
-    ]
 
     return {
         "customer": customer_df,
@@ -130,54 +199,105 @@ def construct_universal_datasets(
         "location": location_df,
         "orders": orders_df,
         "global": global_df,
-        "entity": entity_df,
     }
 
 
+# Dataset cache entries are kept in their own subdirectory of the (user supplied) cache directory, so that pruning
+# old entries can't touch anything else
+DATASET_CACHE_SUBDIR = "feast_universal_datasets"
+
+
+def _read_dataset_cache(cache_dir: Path) -> Optional[Dict[str, pd.DataFrame]]:
+    if not cache_dir.exists():
+        return None
+    try:
+        return {
+            name: pd.read_pickle(cache_dir / f"{name}.pkl")
+            for name in ["customer", "driver", "location", "orders", "global"]
+        }
+    except Exception:
+        # Entries that can't be loaded (e.g. written by another pandas version) are treated as a cache miss, and
+        # removed so that they can be replaced
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return None
+
+
+def _write_dataset_cache(cache_dir: Path, datasets: Dict[str, pd.DataFrame]):
+    # Write into a temporary directory first and move it into place, so that concurrent test processes never
+    # read a partially written cache entry. Failing to cache isn't an error, the datasets are simply regenerated.
+    try:
+        cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=cache_dir.parent))
+    except OSError:
+        return
+    try:
+        for name, df in datasets.items():
+            df.to_pickle(tmp_dir / f"{name}.pkl")
+        os.rename(tmp_dir, cache_dir)
+    except OSError:
+        # Most likely another process populated the same cache entry first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return
+
+    # The key changes with the test time range, so only the latest entry is kept around. The cache directory only
+    # holds entries written here, and temporary directories of concurrent writers have shorter names than entries.
+    for entry in cache_dir.parent.iterdir():
+        if entry != cache_dir and len(entry.name) == len(cache_dir.name):
+            shutil.rmtree(entry, ignore_errors=True)
+
+
 def construct_universal_data_sources(
     datasets: Dict[str, pd.DataFrame], data_source_creator: DataSourceCreator
 ) -> Dict[str, DataSource]:
-    customer_ds = data_source_creator.create_data_source(
-        datasets["customer"],
-        destination_name="customer_profile",
-        event_timestamp_column="event_timestamp",
-        created_timestamp_column="created",
-    )
-    driver_ds = data_source_creator.create_data_source(
-        datasets["driver"],
-        destination_name="driver_hourly",
-        event_timestamp_column="event_timestamp",
-        created_timestamp_column="created",
-    )
-    location_ds = data_source_creator.create_data_source(
-        datasets["location"],
-        destination_name="location_hourly",
-        event_timestamp_column="event_timestamp",
-        created_timestamp_column="created",
-    )
-    orders_ds = data_source_creator.create_data_source(
-        datasets["orders"],
-        destination_name="orders",
-        event_timestamp_column="event_timestamp",
-        created_timestamp_column=None,
-    )
-    global_ds = data_source_creator.create_data_source(
-        datasets["global"],
-        destination_name="global",
-        event_timestamp_column="event_timestamp",
-        created_timestamp_column="created",
-    )
-    return {
-        "customer": customer_ds,
-        "driver": driver_ds,
-        "location": location_ds,
-        "orders": orders_ds,
-        "global": global_ds,
+    # Maps each dataset to its destination name and created timestamp column
+    data_source_specs = {
+        "customer": ("customer_profile", "created"),
+        "driver": ("driver_hourly", "created"),
+        "location": ("location_hourly", "created"),
+        "orders": ("orders", None),
+        "global": ("global", "created"),
     }
 
+    def create_data_source(name: str) -> DataSource:
+        return data_source_creator.create_data_source(
+            datasets[name],
+            destination_name=data_source_specs[name][0],
+            event_timestamp_column="event_timestamp",
+            created_timestamp_column=data_source_specs[name][1],
+        )
+
+    # The data sources are independent of each other and creating them is dominated by uploads to the
+    # offline store, so they're created concurrently if the creator allows it
+    if data_source_creator.supports_concurrent_creation:
+        with ThreadPool(processes=len(data_source_specs)) as pool:
+            data_sources = pool.map(create_data_source, data_source_specs)
+    else:
+        data_sources = [create_data_source(name) for name in data_source_specs]
+    return dict(zip(data_source_specs, data_sources))
+
+
+# Feature views built for each set of data sources, keyed on the identity of the sources (which don't hash).
+# The sources are kept alongside the views so that their ids can't be reused while the entry is cached.
+_universal_feature_views: Dict[
+    Tuple[Tuple[str, int], ...], Tuple[Dict[str, DataSource], Dict[str, FeatureView]],
+] = {}
+
 
 def construct_universal_feature_views(
     data_sources: Dict[str, DataSource],
+) -> Dict[str, FeatureView]:
+    key = tuple((name, id(ds)) for name, ds in sorted(data_sources.items()))
+    if key not in _universal_feature_views:
+        _universal_feature_views[key] = (
+            dict(data_sources),
+            _create_universal_feature_views(data_sources),
+        )
+    _, feature_views = _universal_feature_views[key]
+    return dict(feature_views)
+
+
+def _create_universal_feature_views(
+    data_sources: Dict[str, DataSource],
 ) -> Dict[str, FeatureView]:
     driver_hourly_stats = create_driver_hourly_stats_feature_view(
         data_sources["driver"]
@@ -200,6 +320,10 @@ def construct_universal_feature_views(
     }
 
 
+# All environments in a test session cover the same time range, so that they can share (cached) test datasets
+DEFAULT_END_DATE = datetime.now().replace(microsecond=0, second=0, minute=0)
+
+
 @dataclass
 class Environment:
     name: str
@@ -207,37 +331,51 @@ class Environment:
     feature_store: FeatureStore
     data_source_creator: DataSourceCreator
 
-    end_date: datetime = field(
-        default=datetime.now().replace(microsecond=0, second=0, minute=0)
-    )
+    end_date: datetime = DEFAULT_END_DATE
 
     def __post_init__(self):
         self.start_date: datetime = self.end_date - timedelta(days=3)
 
 
+@functools.singledispatch
 def table_name_from_data_source(ds: DataSource) -> Optional[str]:
-    if hasattr(ds, "table_ref"):
-        return ds.table_ref
-    elif hasattr(ds, "table"):
-        return ds.table
     return None
 
 
+@table_name_from_data_source.register
+def _(ds: BigQuerySource) -> Optional[str]:
+    return ds.table_ref
+
+
+@table_name_from_data_source.register
+def _(ds: RedshiftSource) -> Optional[str]:
+    return ds.table
+
+
+# Test repos (registry and local online store) are created on tmpfs where it's available, to keep them off disk
+_TEST_REPO_DIR_ROOT = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
+
 @contextmanager
 def construct_test_environment(
     test_repo_config: IntegrationTestRepoConfig,
     test_suite_name: str = "integration_test",
 ) -> Environment:
-    project = f"{test_suite_name}_{str(uuid.uuid4()).replace('-', '')[:8]}"
+    project = f"{test_suite_name}_{os.urandom(4).hex()}"
 
-    offline_creator: DataSourceCreator = test_repo_config.offline_store_creator(project)
+    offline_creator: DataSourceCreator = test_repo_config.get_offline_store_creator()(
+        project
+    )
 
     offline_store_config = offline_creator.create_offline_store_config()
     online_store = test_repo_config.online_store
 
-    with tempfile.TemporaryDirectory() as repo_dir_name:
+    with tempfile.TemporaryDirectory(dir=_TEST_REPO_DIR_ROOT) as repo_dir_name:
+        registry_path = Path(repo_dir_name) / "registry.db"
         config = RepoConfig(
-            registry=str(Path(repo_dir_name) / "registry.db"),
+            registry=str(registry_path),
             project=project,
             provider=test_repo_config.provider,
             offline_store=offline_store_config,
@@ -245,9 +383,6 @@ def construct_test_environment(
             repo_path=repo_dir_name,
         )
         fs = FeatureStore(config=config)
-        # We need to initialize the registry, because if nothing is applied in the test before tearing down
-        # the feature store, that will cause the teardown method to blow up.
-        fs.registry._initialize_registry()
         environment = Environment(
             name=project,
             test_repo_config=test_repo_config,
@@ -258,4 +393,7 @@ def construct_test_environment(
         try:
             yield environment
         finally:
-            fs.teardown()
+            # The registry is only created once something is applied. If nothing was, there's nothing to tear
+            # down, and the teardown method would blow up on the missing registry.
+            if registry_path.exists():
+                fs.teardown()
@@ -8,6 +8,10 @@ from feast.repo_config import FeastConfigBaseModel
 
 
 class DataSourceCreator(ABC):
+    # Whether create_data_source may be called from several threads at once. Creators whose clients aren't
+    # thread-safe (e.g. boto3 resources) leave this disabled, and their data sources are created one at a time.
+    supports_concurrent_creation = False
+
     @abstractmethod
     def create_data_source(
         self,
@@ -1,3 +1,15 @@
+"""
+Creates BigQuery data sources for the universal tests.
+
+Creating and deleting a BigQuery dataset for every test environment is slow. When the
+TEST_REUSE_BIGQUERY_DATASET_ENV_NAME environment variable is set to "1", all environments share
+the SHARED_DATASET_NAME dataset instead, and teardown only deletes the (project prefixed) tables
+that the creator tracks in `self.tables`. Any other tables written to the shared dataset during a
+test (e.g. the results of retrieval jobs) aren't deleted, and only go away once they reach the
+dataset's default table expiration of two weeks.
+"""
+import os
+import threading
 from typing import Dict, Optional
 
 import pandas as pd
@@ -5,38 +17,52 @@ from google.cloud import bigquery
 from google.cloud.bigquery import Dataset
 
 from feast import BigQuerySource
+from feast.constants import TEST_REUSE_BIGQUERY_DATASET_ENV_NAME
 from feast.data_source import DataSource
 from feast.infra.offline_stores.bigquery import BigQueryOfflineStoreConfig
 from tests.integration.feature_repos.universal.data_source_creator import (
     DataSourceCreator,
 )
 
+SHARED_DATASET_NAME = "feast_integration_tests"
+
 
 class BigQueryDataSourceCreator(DataSourceCreator):
     dataset: Optional[Dataset] = None
+    supports_concurrent_creation = True
 
     def __init__(self, project_name: str):
         self.client = bigquery.Client()
         self.project_name = project_name
         self.gcp_project = self.client.project
-        self.dataset_id = f"{self.gcp_project}.{project_name}"
+        self.reuse_dataset = os.getenv(TEST_REUSE_BIGQUERY_DATASET_ENV_NAME, "0") == "1"
+        dataset_name = SHARED_DATASET_NAME if self.reuse_dataset else project_name
+        self.dataset_id = f"{self.gcp_project}.{dataset_name}"
 
         self.tables = []
+        self._lock = threading.Lock()
 
     def create_dataset(self):
-        if not self.dataset:
-            self.dataset = bigquery.Dataset(self.dataset_id)
-            print(f"Creating dataset: {self.dataset_id}")
-            self.client.create_dataset(self.dataset, exists_ok=True)
-            self.dataset.default_table_expiration_ms = (
-                1000 * 60 * 60 * 24 * 14
-            )  # 2 weeks in milliseconds
-            self.client.update_dataset(self.dataset, ["default_table_expiration_ms"])
+        with self._lock:
+            if not self.dataset:
+                self.dataset = bigquery.Dataset(self.dataset_id)
+                print(f"Creating dataset: {self.dataset_id}")
+                self.client.create_dataset(self.dataset, exists_ok=True)
+                self.dataset.default_table_expiration_ms = (
+                    1000 * 60 * 60 * 24 * 14
+                )  # 2 weeks in milliseconds
+                self.client.update_dataset(
+                    self.dataset, ["default_table_expiration_ms"]
+                )
 
     def teardown(self):
 
         for table in self.tables:
             self.client.delete_table(table, not_found_ok=True)
+        self.tables = []
+
+        if self.reuse_dataset:
+            return
 
         self.client.delete_dataset(
             self.dataset_id, delete_contents=True, not_found_ok=True
@@ -62,14 +88,13 @@ class BigQueryDataSourceCreator(DataSourceCreator):
         self.create_dataset()
 
         if self.gcp_project not in destination_name:
-            destination_name = (
-                f"{self.gcp_project}.{self.project_name}.{destination_name}"
-            )
+            destination_name = f"{self.dataset_id}.{destination_name}"
 
         job = self.client.load_table_from_dataframe(df, destination_name)
         job.result()
 
-        self.tables.append(destination_name)
+        with self._lock:
+            self.tables.append(destination_name)
 
         return BigQuerySource(
             table_ref=destination_name,
@@ -80,4 +105,6 @@ class BigQueryDataSourceCreator(DataSourceCreator):
         )
 
     def get_prefixed_table_name(self, suffix: str) -> str:
-        return f"{self.client.project}.{self.project_name}.{suffix}"
+        if self.reuse_dataset:
+            return f"{self.dataset_id}.{self.project_name}_{suffix}"
+        return f"{self.dataset_id}.{suffix}"
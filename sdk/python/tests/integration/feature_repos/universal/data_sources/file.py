@@ -1,4 +1,5 @@
 import tempfile
+import threading
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
@@ -18,10 +19,12 @@ from tests.integration.feature_repos.universal.data_source_creator import (
 
 class FileDataSourceCreator(DataSourceCreator):
     files: List[Any]
+    supports_concurrent_creation = True
 
     def __init__(self, project_name: str):
         self.project_name = project_name
         self.files = []
+        self._lock = threading.Lock()
 
     def create_data_source(
         self,
@@ -40,7 +43,8 @@ class FileDataSourceCreator(DataSourceCreator):
             delete=False,
         )
         df.to_parquet(f.name)
-        self.files.append(f)
+        with self._lock:
+            self.files.append(f)
         return FileSource(
             file_format=ParquetFormat(),
             path=f"{f.name}",
@@ -0,0 +1,160 @@
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pyarrow
+import pyarrow.parquet as pq
+import pytest
+
+import feast.driver_test_data as driver_data
+from feast import Entity, Feature, FeatureStore, FeatureView, FileSource, ValueType
+from feast.errors import FileSourceMissingColumns
+from feast.infra.offline_stores.file import FileOfflineStore
+from feast.repo_config import RepoConfig
+
+
+@pytest.fixture
+def partitioned_driver_source():
+    """ Driver stats written as a hive partitioned dataset, with driver_id only present in the directory names """
+    end_date = datetime.now().replace(microsecond=0, second=0, minute=0)
+    start_date = end_date - timedelta(days=2)
+    driver_df = driver_data.create_driver_hourly_stats_df(
+        [1001, 1002, 1003], start_date, end_date
+    )
+    with tempfile.TemporaryDirectory() as data_dir:
+        pq.write_to_dataset(
+            pyarrow.Table.from_pandas(driver_df, preserve_index=False),
+            root_path=data_dir,
+            partition_cols=["driver_id"],
+        )
+        assert (Path(data_dir) / "driver_id=1001").is_dir()
+        source = FileSource(
+            path=data_dir,
+            event_timestamp_column="event_timestamp",
+            created_timestamp_column="created",
+        )
+        yield source, driver_df, start_date, end_date
+
+
+@pytest.fixture
+def feature_store():
+    with tempfile.TemporaryDirectory() as repo_dir:
+        yield FeatureStore(
+            config=RepoConfig(
+                registry=str(Path(repo_dir) / "registry.db"),
+                project="partitioned_source",
+                provider="local",
+                online_store={"path": str(Path(repo_dir) / "online_store.db")},
+                repo_path=repo_dir,
+            )
+        )
+
+
+def _driver_stats_view(source: FileSource) -> FeatureView:
+    return FeatureView(
+        name="driver_stats",
+        entities=["driver_id"],
+        features=[Feature(name="conv_rate", dtype=ValueType.FLOAT)],
+        ttl=timedelta(days=1),
+        batch_source=source,
+    )
+
+
+def test_historical_features_from_partitioned_source(
+    feature_store, partitioned_driver_source
+):
+    source, driver_df, _, end_date = partitioned_driver_source
+    feature_store.apply(
+        [
+            Entity(name="driver_id", value_type=ValueType.INT64),
+            _driver_stats_view(source),
+        ]
+    )
+    entity_df = driver_df[["driver_id", "event_timestamp"]].copy()
+
+    job = feature_store.get_historical_features(
+        entity_df=entity_df, features=["driver_stats:conv_rate"]
+    )
+    actual_df = job.to_df()
+
+    expected_df = driver_df[["driver_id", "event_timestamp", "conv_rate"]]
+    actual_df = actual_df[["driver_id", "event_timestamp", "conv_rate"]]
+    sort_by = ["driver_id", "event_timestamp"]
+    assert actual_df["conv_rate"].notna().all()
+    assert (
+        actual_df.sort_values(sort_by)["conv_rate"].tolist()
+        == expected_df.sort_values(sort_by)["conv_rate"].tolist()
+    )
+
+
+def test_pull_latest_from_partitioned_source(partitioned_driver_source):
+    source, driver_df, start_date, end_date = partitioned_driver_source
+
+    actual_df = FileOfflineStore.pull_latest_from_table_or_query(
+        config=None,
+        data_source=source,
+        join_key_columns=["driver_id"],
+        feature_name_columns=["conv_rate"],
+        event_timestamp_column="event_timestamp",
+        created_timestamp_column="created",
+        start_date=start_date,
+        end_date=end_date + timedelta(hours=1),
+    ).to_df()
+
+    latest_df = driver_df.sort_values("event_timestamp").drop_duplicates(
+        "driver_id", keep="last"
+    )
+    assert sorted(actual_df["driver_id"].astype(int).tolist()) == [1001, 1002, 1003]
+    assert sorted(actual_df["conv_rate"].tolist()) == sorted(
+        latest_df["conv_rate"].tolist()
+    )
+
+
+def test_missing_source_columns_are_an_error(partitioned_driver_source):
+    source, _, start_date, end_date = partitioned_driver_source
+
+    with pytest.raises(FileSourceMissingColumns):
+        FileOfflineStore.pull_latest_from_table_or_query(
+            config=None,
+            data_source=source,
+            join_key_columns=["driver_id"],
+            feature_name_columns=["conv_rate", "not_a_feature"],
+            event_timestamp_column="event_timestamp",
+            created_timestamp_column="created",
+            start_date=start_date,
+            end_date=end_date,
+        ).to_df()
+
+
+def test_pull_latest_with_sub_unit_end_date():
+    # The source only has millisecond precision, while the end date falls in between two milliseconds
+    event_timestamp = datetime(2021, 8, 1, 12, 0, 0)
+    end_date = event_timestamp + timedelta(microseconds=500)
+    table = pyarrow.table(
+        {
+            "driver_id": pyarrow.array([1001, 1002], type=pyarrow.int64()),
+            "conv_rate": pyarrow.array([0.1, 0.2], type=pyarrow.float32()),
+            "event_timestamp": pyarrow.array(
+                [event_timestamp, event_timestamp + timedelta(milliseconds=1)],
+                type=pyarrow.timestamp("ms", tz="UTC"),
+            ),
+        }
+    )
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = str(Path(data_dir) / "driver_stats.parquet")
+        pq.write_table(table, path)
+        source = FileSource(path=path, event_timestamp_column="event_timestamp")
+
+        actual_df = FileOfflineStore.pull_latest_from_table_or_query(
+            config=None,
+            data_source=source,
+            join_key_columns=["driver_id"],
+            feature_name_columns=["conv_rate"],
+            event_timestamp_column="event_timestamp",
+            created_timestamp_column=None,
+            start_date=event_timestamp - timedelta(hours=1),
+            end_date=end_date,
+        ).to_df()
+
+    # The row at 12:00:00.000 is inside the window, the one at 12:00:00.001 isn't
+    assert actual_df["driver_id"].tolist() == [1001]
@@ -83,7 +83,9 @@ def test_universal_cli(test_repo_config) -> None:
 
 
 def make_feature_store_yaml(project, test_repo_config, repo_dir_name: PosixPath):
-    offline_creator: DataSourceCreator = test_repo_config.offline_store_creator(project)
+    offline_creator: DataSourceCreator = test_repo_config.get_offline_store_creator()(
+        project
+    )
 
     offline_store_config = offline_creator.create_offline_store_config()
     online_store = test_repo_config.online_store
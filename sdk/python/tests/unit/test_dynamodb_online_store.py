@@ -0,0 +1,290 @@
+from datetime import datetime, timedelta
+
+import pytest
+from moto import mock_dynamodb2
+
+from feast import Entity, FeatureView, FileSource, ValueType
+from feast.errors import DynamoDBTableSchemaMismatch, DynamoDBUnprocessedItemsError
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores import dynamodb
+from feast.infra.online_stores.dynamodb import (
+    DynamoDBOnlineStore,
+    DynamoDBOnlineStoreConfig,
+)
+from feast.infra.online_stores.helpers import compute_binary_entity_id
+from feast.protos.feast.storage.DynamoDB_pb2 import (
+    DynamoDBFeatureValues as DynamoDBFeatureValuesProto,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+REGION = "us-west-2"
+
+
+@pytest.fixture
+def repo_config():
+    return RepoConfig(
+        registry="registry.db",
+        project="test_project",
+        provider="aws",
+        online_store=DynamoDBOnlineStoreConfig(region=REGION),
+        offline_store=FileOfflineStoreConfig(),
+    )
+
+
+@pytest.fixture
+def feature_view():
+    return FeatureView(
+        name="driver_stats",
+        entities=["driver_id"],
+        ttl=timedelta(days=1),
+        batch_source=FileSource(
+            path="driver_stats.parquet", event_timestamp_column="ts"
+        ),
+    )
+
+
+@pytest.fixture
+def online_store(monkeypatch, repo_config, feature_view):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", REGION)
+    # Unprocessed items are retried right away, rather than after a backoff
+    monkeypatch.setattr(dynamodb, "_backoff_delay", lambda attempt: 0)
+    with mock_dynamodb2():
+        store = DynamoDBOnlineStore()
+        store.update(
+            repo_config,
+            tables_to_delete=[],
+            tables_to_keep=[feature_view],
+            entities_to_delete=[],
+            entities_to_keep=[Entity(name="driver_id", value_type=ValueType.INT64)],
+            partial=False,
+        )
+        yield store
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+def _write_rows(store, repo_config, feature_view, driver_ids, event_ts):
+    store.online_write_batch(
+        repo_config,
+        feature_view,
+        [
+            (
+                _entity_key(driver_id),
+                {"conv_rate": ValueProto(double_val=driver_id / 10)},
+                event_ts,
+                None,
+            )
+            for driver_id in driver_ids
+        ],
+        progress=None,
+    )
+
+
+def test_online_read_more_keys_than_batch_size(online_store, repo_config, feature_view):
+    driver_ids = list(range(250))
+    _write_rows(online_store, repo_config, feature_view, driver_ids, datetime.utcnow())
+
+    result = online_store.online_read(
+        repo_config, feature_view, [_entity_key(i) for i in driver_ids]
+    )
+
+    assert len(result) == len(driver_ids)
+    for driver_id, (event_ts, values) in zip(driver_ids, result):
+        assert event_ts is not None
+        assert values["conv_rate"].double_val == driver_id / 10
+
+
+def test_online_read_duplicate_and_missing_keys(
+    online_store, repo_config, feature_view
+):
+    _write_rows(online_store, repo_config, feature_view, [1, 2], datetime.utcnow())
+
+    result = online_store.online_read(
+        repo_config, feature_view, [_entity_key(i) for i in [2, 3, 1, 2, 3]],
+    )
+
+    assert [
+        values["conv_rate"].double_val if values else None for _, values in result
+    ] == [0.2, None, 0.1, 0.2, None]
+    assert result[1] == (None, None)
+    assert result[4] == (None, None)
+
+
+def test_online_write_batch_round_trip(online_store, repo_config, feature_view):
+    event_ts = datetime(2021, 8, 1, 12, 30)
+    _write_rows(online_store, repo_config, feature_view, range(60), event_ts)
+
+    # Items are keyed on the binary entity id, and hold the values as a serialized blob
+    item = online_store._get_dynamodb_client(REGION).get_item(
+        TableName="test_project.driver_stats",
+        Key={"entity_id": {"B": compute_binary_entity_id(_entity_key(7))}},
+    )["Item"]
+    values = DynamoDBFeatureValuesProto.FromString(item["values"]["B"]).values
+    assert values["conv_rate"].double_val == 0.7
+
+    result = online_store.online_read(
+        repo_config, feature_view, [_entity_key(i) for i in range(60)]
+    )
+    assert [values["conv_rate"].double_val for _, values in result] == [
+        i / 10 for i in range(60)
+    ]
+    assert all(ts == "2021-08-01 12:30:00+00:00" for ts, _ in result)
+
+
+def test_online_write_batch_deduplicates_entity_keys(
+    online_store, repo_config, feature_view
+):
+    event_ts = datetime.utcnow()
+    progress_updates = []
+    online_store.online_write_batch(
+        repo_config,
+        feature_view,
+        [
+            (_entity_key(1), {"conv_rate": ValueProto(double_val=1.0)}, event_ts, None),
+            (_entity_key(2), {"conv_rate": ValueProto(double_val=2.0)}, event_ts, None),
+            (_entity_key(1), {"conv_rate": ValueProto(double_val=3.0)}, event_ts, None),
+        ],
+        progress=progress_updates.append,
+    )
+
+    # Later rows for an entity win, and every row is reported as processed
+    result = online_store.online_read(
+        repo_config, feature_view, [_entity_key(1), _entity_key(2)]
+    )
+    assert [values["conv_rate"].double_val for _, values in result] == [3.0, 2.0]
+    assert sum(progress_updates) == 3
+
+
+class _UnprocessedItemsClient:
+    """Wraps a DynamoDB client so that BatchWriteItem never processes any items."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def batch_write_item(self, RequestItems):
+        self.calls += 1
+        return {"UnprocessedItems": RequestItems}
+
+
+def test_online_write_batch_gives_up_on_unprocessed_items(
+    online_store, repo_config, feature_view
+):
+    client = _UnprocessedItemsClient()
+    online_store._dynamodb_client = client
+
+    with pytest.raises(DynamoDBUnprocessedItemsError):
+        _write_rows(online_store, repo_config, feature_view, [1], datetime.utcnow())
+    assert client.calls == dynamodb._MAX_BATCH_ATTEMPTS
+
+
+class _UnprocessedKeysClient:
+    """Wraps a DynamoDB client so that BatchGetItem only processes a few keys per call."""
+
+    def __init__(self, client, keys_per_call: int):
+        self._client = client
+        self.keys_per_call = keys_per_call
+        self.calls = 0
+
+    def batch_get_item(self, RequestItems):
+        self.calls += 1
+        response = {"Responses": {}, "UnprocessedKeys": {}}
+        for table_name, request in RequestItems.items():
+            keys = request["Keys"]
+            if self.keys_per_call > 0:
+                processed = self._client.batch_get_item(
+                    RequestItems={table_name: {"Keys": keys[: self.keys_per_call]}}
+                )
+                response["Responses"].update(processed["Responses"])
+            if len(keys) > self.keys_per_call:
+                response["UnprocessedKeys"][table_name] = {
+                    "Keys": keys[self.keys_per_call :]
+                }
+        return response
+
+
+def test_online_read_retries_unprocessed_keys(online_store, repo_config, feature_view):
+    _write_rows(online_store, repo_config, feature_view, [1, 2, 3], datetime.utcnow())
+    client = _UnprocessedKeysClient(
+        online_store._get_dynamodb_client(REGION), keys_per_call=1
+    )
+    online_store._dynamodb_client = client
+
+    result = online_store.online_read(
+        repo_config, feature_view, [_entity_key(i) for i in [1, 2, 3]]
+    )
+
+    assert [values["conv_rate"].double_val for _, values in result] == [0.1, 0.2, 0.3]
+    assert client.calls == 3
+
+
+def test_online_read_gives_up_on_unprocessed_keys(
+    online_store, repo_config, feature_view
+):
+    _write_rows(online_store, repo_config, feature_view, [1, 2], datetime.utcnow())
+    client = _UnprocessedKeysClient(
+        online_store._get_dynamodb_client(REGION), keys_per_call=0
+    )
+    online_store._dynamodb_client = client
+
+    with pytest.raises(DynamoDBUnprocessedItemsError):
+        online_store.online_read(
+            repo_config, feature_view, [_entity_key(i) for i in [1, 2]]
+        )
+    assert client.calls == dynamodb._MAX_BATCH_ATTEMPTS
+
+
+def test_update_keeps_existing_table(online_store, repo_config, feature_view):
+    _write_rows(online_store, repo_config, feature_view, [1], datetime.utcnow())
+
+    online_store.update(
+        repo_config,
+        tables_to_delete=[],
+        tables_to_keep=[feature_view],
+        entities_to_delete=[],
+        entities_to_keep=[],
+        partial=False,
+    )
+
+    result = online_store.online_read(repo_config, feature_view, [_entity_key(1)])
+    assert result[0][1]["conv_rate"].double_val == 0.1
+
+
+def test_update_rejects_string_keyed_table(online_store, repo_config, feature_view):
+    # Tables created by older versions of Feast are keyed on string entity ids
+    string_keyed_view = FeatureView(
+        name="string_keyed_driver_stats",
+        entities=["driver_id"],
+        ttl=timedelta(days=1),
+        batch_source=feature_view.batch_source,
+    )
+    online_store._get_dynamodb_client(REGION).create_table(
+        TableName="test_project.string_keyed_driver_stats",
+        KeySchema=[{"AttributeName": "entity_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "entity_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+    with pytest.raises(DynamoDBTableSchemaMismatch):
+        online_store.update(
+            repo_config,
+            tables_to_delete=[],
+            tables_to_keep=[string_keyed_view],
+            entities_to_delete=[],
+            entities_to_keep=[],
+            partial=False,
+        )
+
+
+def test_read_batch_size_is_limited():
+    with pytest.raises(ValueError):
+        DynamoDBOnlineStoreConfig(region=REGION, read_batch_size=101)
+    with pytest.raises(ValueError):
+        DynamoDBOnlineStoreConfig(region=REGION, read_batch_size=0)